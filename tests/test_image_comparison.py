@@ -0,0 +1,186 @@
+import os
+import sys
+
+import numpy
+import pytest
+
+pytest.importorskip('OpenImageIO')
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS_DIR), 'python'))
+
+from OpenImageIO import (  # noqa: E402
+    FLOAT,
+    ImageBuf,
+    ImageBufAlgo,
+    ImageSpec,
+    ROI,
+)
+from image_comparison import (  # noqa: E402
+    _color_map,
+    _INFERNO_LUT,
+    _morton_order,
+    ImageCompare,
+    ImageDifferenceError,
+    ImageProcessingError,
+)
+
+
+def _image(name):
+    return os.path.join(TESTS_DIR, name)
+
+
+def _write_filled(path, values, size=64):
+    image = ImageBufAlgo.fill(
+        values,
+        roi=ROI(0, size, 0, size, 0, 1, 0, len(values)),
+    )
+    assert image.write(str(path))
+
+    return str(path)
+
+
+def test_rgba_difference_fails(tmp_path):
+    ic = ImageCompare(_image('image_a.png'), _image('image_b.png'))
+    with pytest.raises(ImageDifferenceError):
+        ic.compare(diff_image_location=str(tmp_path), blur=2)
+    assert ic._compare_results.nfail > 0
+
+
+def test_rgba_mean_error(tmp_path):
+    ic = ImageCompare(_image('image_a.png'), _image('image_c.png'))
+    ic.compare(
+        diff_image_location=str(tmp_path),
+        blur=10,
+        raise_exception=False,
+    )
+    assert ic._compare_results.meanerror > 0.0
+
+
+@pytest.mark.parametrize('size_b', [32, 128])
+def test_different_data_windows_raise(tmp_path, size_b):
+    path_a = _write_filled(tmp_path / 'a.png', (0.2, 0.2, 0.2))
+    path_b = _write_filled(tmp_path / 'b.png', (0.8, 0.8, 0.8), size_b)
+    with pytest.raises(ImageProcessingError):
+        ImageCompare(path_a, path_b)
+
+
+def test_truncated_image_raises(tmp_path):
+    with open(_image('image_b.png'), 'rb') as image:
+        data = image.read()
+    path_b = tmp_path / 'image_b.png'
+    path_b.write_bytes(data[:len(data) // 2])
+
+    ic = ImageCompare(_image('image_a.png'), str(path_b))
+    with pytest.raises(ImageProcessingError):
+        ic.compare(diff_image_location=str(tmp_path), blur=2)
+
+
+def test_float_difference_fails(tmp_path):
+    paths = [
+        _write_filled(tmp_path / 'low.exr', (2.0, 2.0, 2.0)),
+        _write_filled(tmp_path / 'high.exr', (4.0, 4.0, 4.0)),
+    ]
+
+    ic = ImageCompare(*paths)
+    with pytest.raises(ImageDifferenceError):
+        ic.compare(diff_image_location=str(tmp_path), blur=2)
+    assert ic._compare_results.nfail == 64 * 64
+
+
+@pytest.mark.parametrize('size', [3, 10, 20])
+def test_gpu_blur_matches_cpu(size):
+    pytest.importorskip('cupy')
+    ic = ImageCompare(_image('image_a.png'), _image('image_c.png'))
+    cpu = ic._blur(ic.image_a_buffer, size).get_pixels(FLOAT, ic._roi)
+    gpu = ic._blur_gpu(ic.image_a_buffer, size).get_pixels(FLOAT, ic._roi)
+
+    # small sizes are convolved with pixels outside the image as black,
+    # larger ones are box blur approximations of the gaussian
+    interior = (slice(size, -size), slice(size, -size))
+    assert numpy.abs(cpu[interior] - gpu[interior]).max() < 0.03
+
+
+@pytest.mark.parametrize('size', [4, 7, 8, 10, 20])
+def test_box_blur_matches_gaussian(size):
+    ic = ImageCompare(
+        _image('test_low_samples.png'),
+        _image('test_high_samples.png'),
+    )
+    source = ic._open(ic.image_a_buffer)
+    box = ic._box_blur_gaussian(source, size).get_pixels(FLOAT, ic._roi)
+    ic.box_blur_min_size = float('inf')
+    gaussian = ic._blur(ic.image_a_buffer, size).get_pixels(FLOAT, ic._roi)
+
+    # convolve treats pixels outside the image as black, the box blur
+    # clamps to the edge
+    interior = (slice(size, -size), slice(size, -size))
+    difference = numpy.abs(box[interior] - gaussian[interior])
+    assert difference.mean() < 0.0005
+    assert difference.max() < 0.05
+
+
+@pytest.mark.parametrize('channels', [1, 2, 3])
+def test_color_map_matches_oiio(channels):
+    pixels = numpy.random.default_rng(0).random((8, 32, channels))
+    pixels = pixels.astype(numpy.float32)
+    source = ImageBuf(ImageSpec(32, 8, channels, FLOAT))
+    source.set_pixels(source.roi, pixels)
+    expected = ImageBuf()
+    assert ImageBufAlgo.color_map(expected, source, -1, 'inferno')
+
+    mapped = _color_map(pixels, _INFERNO_LUT)
+    # the lookup table quantizes to 256 steps
+    assert numpy.abs(mapped - expected.get_pixels(FLOAT)).max() < 0.01
+
+
+def test_grayscale_difference_fails(tmp_path):
+    path_a = _write_filled(tmp_path / 'a.png', (0.2,))
+    path_b = _write_filled(tmp_path / 'b.png', (0.8,))
+
+    ic = ImageCompare(path_a, path_b)
+    with pytest.raises(ImageDifferenceError):
+        ic.compare(diff_image_location=str(tmp_path), blur=2)
+    assert ic._compare_results.nfail == 64 * 64
+
+    diff = ImageBuf(str(tmp_path / 'a.png-b.png_diff.png'))
+    assert diff.nchannels == 3
+
+
+def test_grayscale_alpha_is_ignored(tmp_path):
+    # grey is associated with alpha, so both images show the same grey
+    path_a = _write_filled(tmp_path / 'a.png', (0.1, 0.2))
+    path_b = _write_filled(tmp_path / 'b.png', (0.1, 0.8))
+
+    ic = ImageCompare(path_a, path_b)
+    ic.compare(diff_image_location=str(tmp_path), blur=2)
+    assert ic._compare_results.nfail == 0
+
+
+@pytest.mark.parametrize('tile_size', [37, 256])
+@pytest.mark.parametrize('size', [4, 10, 20])
+def test_tiled_box_blur_matches_untiled(size, tile_size):
+    ic = ImageCompare(
+        _image('test_low_samples.png'),
+        _image('test_high_samples.png'),
+    )
+    source = ic._open(ic.image_a_buffer)
+    ic.tile_size = 10000
+    untiled = ic._box_blur_gaussian(source, size).get_pixels(FLOAT)
+    ic.tile_size = tile_size
+    tiled = ic._box_blur_gaussian(source, size).get_pixels(FLOAT)
+
+    assert numpy.array_equal(tiled, untiled)
+
+
+@pytest.mark.parametrize(
+    'columns, rows',
+    [(1, 1), (3, 2), (2, 5), (5, 7), (16, 9)],
+)
+def test_morton_order_visits_every_tile_once(columns, rows):
+    tiles = list(_morton_order(columns, rows))
+
+    assert len(tiles) == columns * rows
+    assert set(tiles) == {
+        (column, row) for column in range(columns) for row in range(rows)
+    }